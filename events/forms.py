@@ -1,9 +1,10 @@
 from django.utils.safestring import mark_safe
+from django.utils.html import format_html
 from django import forms
-from django.forms.widgets import TextInput, Media
+from django.forms.widgets import TextInput
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.validators import validate_email
 from django.utils.translation import ugettext_lazy as _
-from django.utils import timezone
 
 from django.contrib.auth.models import User
 from .models.locale import Country, SPR, City
@@ -20,13 +21,51 @@ from .models.speakers import (
     Speaker,
     Talk,
     Presentation,
-    SpeakerRequest,
 )
 import recurrence
 
 import pytz
+import re
 from datetime import time
-from time import strptime, strftime
+from functools import lru_cache
+
+_TIME_CHOICES = tuple((t, t) for t in (
+    f'{hour:02d}:{minute:02d} {m}'
+    for m in ('AM', 'PM')
+    for hour in (12, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+    for minute in range(0, 60, 30)
+))
+_HOUR_CHOICES = tuple((i, f'{i:02d}') for i in range(1, 13))
+_MINUTE_CHOICES = tuple((i, f'{i:02d}') for i in range(0, 60, 15))
+_MERIDIAN_CHOICES = (('AM', _('AM')), ('PM', _('PM')))
+
+_EMAIL_SPLIT = re.compile(r'[,\s]+')
+_EMAIL_QUICK = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+@lru_cache(maxsize=None)
+def _tz(name):
+    return pytz.timezone(name)
+
+def _to_utc(value, tz):
+    """Treat value's wall-clock time as local to tz and convert it to UTC.
+    """
+    return tz.localize(value.replace(tzinfo=None)).astimezone(pytz.utc)
+
+def _to_24h(hour, meridian):
+    hour = int(hour)
+    if not 1 <= hour <= 12 or meridian.upper() not in ('AM', 'PM'):
+        raise ValueError("Invalid 12-hour time: %s %s" % (hour, meridian))
+    return hour % 12 + (12 if meridian.upper() == 'PM' else 0)
+
+def _parse_ampm(value):
+    """Parse an 'HH:MM AM' string into a 24-hour (hour, minute) tuple.
+    """
+    hour, rest = value.split(':', 1)
+    minute, meridian = rest.split()
+    minute = int(minute)
+    if not 0 <= minute < 60:
+        raise ValueError("Invalid minute: %s" % minute)
+    return _to_24h(hour, meridian), minute
 
 class Lookup(TextInput):
     input_type = 'text'
@@ -35,35 +74,105 @@ class Lookup(TextInput):
     checked_attribute = {'selected': True}
     option_inherits_attrs = False
 
-    def __init__(self, source, key="id", label='__str__', attrs=None):
+    def __init__(self, source, key="id", label='__str__', attrs=None, instance=None):
         super().__init__(attrs)
         self.source = source
         self.key = key
         self.label = label
-
-    def get_context(self, name, value, attrs):
-        context = super().get_context(name, value, attrs)
-        return context
+        self.instance = instance
+        self.resolver = None
 
     def format_value(self, value):
         if value is not None:
-            lookup_query = {self.key: value}
-            lookup_object = self.source.objects.get(**lookup_query)
+            if self.instance is not None and str(getattr(self.instance, self.key)) == str(value):
+                lookup_object = self.instance
+            else:
+                lookup_object = None
+                if self.resolver is not None:
+                    lookup_object = self.resolver.get(self.source, value)
+                if lookup_object is None:
+                    lookup_query = {self.key: value}
+                    lookup_object = self.source.objects.get(**lookup_query)
             lookup_field = getattr(lookup_object, self.label)
             if callable(lookup_field):
                 lookup_value = lookup_field()
             else:
                 lookup_value = lookup_field
-            return mark_safe('<option value="%s">%s</option>' % (value, lookup_value))
+            return format_html('<option value="{}">{}</option>', value, lookup_value)
         else:
             return mark_safe('<option value="">--------</option>')
 
+    @classmethod
+    def resolve_batch(cls, sources_map):
+        """Fetch {Model: set(pks)} with one query per model.
+
+        Returns a dict of {(Model, str(pk)): instance}.
+        """
+        resolved = {}
+        for source, pks in sources_map.items():
+            for obj in source.objects.filter(pk__in=pks):
+                resolved[(source, str(obj.pk))] = obj
+        return resolved
+
+class LookupResolver:
+    """Batches the Lookup values of one form, fetching them on first use.
+    """
+    def __init__(self):
+        self.sources_map = {}
+        self.resolved = None
+
+    def add(self, source, value):
+        self.sources_map.setdefault(source, set()).add(value)
+
+    def get(self, source, value):
+        if self.resolved is None:
+            self.resolved = Lookup.resolve_batch(self.sources_map)
+        return self.resolved.get((source, str(value)))
+
+class LookupFormMixin:
+    """Resolves the selected objects for all of a form's Lookup widgets together.
+
+    Related objects already cached on the form's instance (e.g. loaded with
+    select_related) are used directly. Everything else is fetched the first
+    time one of the widgets is rendered, with one query per model instead of
+    one query per widget, so forms that are only validated never query.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        instance = getattr(self, 'instance', None)
+        resolver = LookupResolver()
+        for name, field in self.fields.items():
+            widget = field.widget
+            if not isinstance(widget, Lookup) or widget.key not in ('id', 'pk'):
+                continue
+            value = self[name].value()
+            if value in (None, ''):
+                continue
+            try:
+                value = widget.source._meta.pk.to_python(value)
+            except (ValueError, ValidationError):
+                # Leave invalid values for the field's clean() to report
+                continue
+            if instance is not None:
+                try:
+                    model_field = instance._meta.get_field(name)
+                except FieldDoesNotExist:
+                    model_field = None
+                if model_field is not None and model_field.many_to_one and model_field.is_cached(instance):
+                    related = model_field.get_cached_value(instance)
+                    if related is not None and related.pk == value:
+                        widget.instance = related
+                        continue
+            resolver.add(widget.source, value)
+            widget.resolver = resolver
+
 class DateWidget(forms.DateInput):
     """A more-friendly date widget with a p% if widget.value != None %} value="{{ widget.value|stringformat:'s' }}"{% endif %op-up calendar.
     """
     template_name = 'forms/widgets/date.html'
+    date_class = 'datepicker'
+
     def __init__(self, attrs=None):
-        self.date_class = 'datepicker'
         if not attrs:
             attrs = {}
         if 'date_class' in attrs:
@@ -77,8 +186,9 @@ class DateWidget(forms.DateInput):
 class SimpleTimeWidget(forms.Select):
     """A single dropdown time widget
     """
+    time_class = 'timepicker'
+
     def __init__(self, attrs=None):
-        self.time_class = 'timepicker'
         if not attrs:
             attrs = {}
         if 'time_class' in attrs:
@@ -86,26 +196,21 @@ class SimpleTimeWidget(forms.Select):
         if 'class' not in attrs:
             attrs['class'] = 'time'
 
-        choices = []
-        for m in ('AM', 'PM'):
-            for hour in range(0, 12):
-                if hour == 0:
-                    hour = 12
-                for minute in range(00, 60, 30):
-                    choices.append(('%02d:%02d %s' % (hour, minute, m), ('%02d:%02d %s' % (hour, minute, m))))
-
-        super(SimpleTimeWidget, self).__init__(attrs, choices)
+        super(SimpleTimeWidget, self).__init__(attrs, _TIME_CHOICES)
 
     def value_from_datadict(self, data, files, name):
-        value = super(SimpleTimeWidget, self).value_from_datadict(data, files, name)
-        t = strptime(value, "%I:%M %p")
-        return strftime("%H:%M:%S", t)
+        value = forms.Select.value_from_datadict(self, data, files, name)
+        if not value:
+            return None
+        hour, minute = _parse_ampm(value)
+        return f"{hour:02d}:{minute:02d}:00"
 
 class TimeWidget(forms.MultiWidget):
     """A more-friendly time widget.
     """
+    time_class = 'timepicker'
+
     def __init__(self, attrs=None):
-        self.time_class = 'timepicker'
         if not attrs:
             attrs = {}
         if 'time_class' in attrs:
@@ -114,44 +219,32 @@ class TimeWidget(forms.MultiWidget):
             attrs['class'] = 'time'
 
         widgets = (
-            forms.Select(attrs=attrs, choices=[(i + 1, "%02d" % (i + 1)) for i in range(0, 12)]),
-            forms.Select(attrs=attrs, choices=[(i, "%02d" % i) for i in range(00, 60, 15)]),
-            forms.Select(attrs=attrs, choices=[('AM', _('AM')), ('PM', _('PM'))])
+            forms.Select(attrs=attrs, choices=_HOUR_CHOICES),
+            forms.Select(attrs=attrs, choices=_MINUTE_CHOICES),
+            forms.Select(attrs=attrs, choices=_MERIDIAN_CHOICES)
         )
 
         super(TimeWidget, self).__init__(widgets, attrs)
 
     def decompress(self, value):
         if isinstance(value, str):
-            try:
-                value = strptime(value, '%I:%M %p')
-            except:
-                value = strptime(value, '%H:%M:%S')
-            hour = int(value.tm_hour)
-            minute = int(value.tm_min)
-            if hour < 12:
-                meridian = 'AM'
+            if value[-2:].upper() in ('AM', 'PM'):
+                hour, minute = _parse_ampm(value)
             else:
-                meridian = 'PM'
-                hour -= 12
-            return (hour, minute, meridian)
+                hour, minute = (int(part) for part in value.split(':')[:2])
+            return (hour % 12 or 12, minute, 'PM' if hour >= 12 else 'AM')
         elif isinstance(value, time):
-            hour = int(value.strftime("%I"))
-            minute = int(value.strftime("%M"))
-            meridian = value.strftime("%p")
-            return (hour, minute, meridian)
+            hour = value.hour
+            return (hour % 12 or 12, value.minute, 'PM' if hour >= 12 else 'AM')
         return (None, None, None)
 
     def value_from_datadict(self, data, files, name):
-        value = super(TimeWidget, self).value_from_datadict(data, files, name)
-        t = strptime("%02d:%02d %s" % (int(value[0]), int(value[1]), value[2]), "%I:%M %p")
-        return strftime("%H:%M:%S", t)
+        value = forms.MultiWidget.value_from_datadict(self, data, files, name)
+        hour = _to_24h(value[0], value[2])
+        return f"{hour:02d}:{int(value[1]):02d}:00"
 
     def format_output(self, rendered_widgets):
-        return '<span class="%s">%s%s%s</span>' % (
-            self.time_class,
-            rendered_widgets[0], rendered_widgets[1], rendered_widgets[2]
-        )
+        return f'<span class="{self.time_class}">{rendered_widgets[0]}{rendered_widgets[1]}{rendered_widgets[2]}</span>'
 
 class DateTimeWidget(forms.SplitDateTimeWidget):
     """
@@ -166,20 +259,22 @@ class DateTimeWidget(forms.SplitDateTimeWidget):
 
     def decompress(self, value):
         if value:
-            d = strftime("%Y-%m-%d", value.timetuple())
-            t = strftime("%I:%M %p", value.timetuple())
+            d = f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+            t = f"{value.hour % 12 or 12:02d}:{value.minute:02d} {'PM' if value.hour >= 12 else 'AM'}"
             return (d, t)
         else:
             return (None, None)
 
     def format_output(self, rendered_widgets):
-        return '%s %s' % (rendered_widgets[0], rendered_widgets[1])
+        return f'{rendered_widgets[0]} {rendered_widgets[1]}'
 
     def value_from_datadict(self, data, files, name):
         values = super(DateTimeWidget, self).value_from_datadict(data, files, name)
+        if not all(values):
+            return None
         return ' '.join(values)
 
-class TeamForm(forms.ModelForm):
+class TeamForm(LookupFormMixin, forms.ModelForm):
     class Meta:
         model = Team
         fields = [
@@ -200,7 +295,7 @@ class TeamForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         self.fields['city'].required = True
 
-class NewTeamForm(forms.ModelForm):
+class NewTeamForm(LookupFormMixin, forms.ModelForm):
     class Meta:
         model = Team
         fields = [
@@ -235,22 +330,39 @@ class MultiEmailField(forms.Field):
         # Return an empty list if no input was given.
         if not value:
             return []
-        return [email.strip() for email in value.split(',')]
+        return [email for email in _EMAIL_SPLIT.split(value) if email]
 
     def validate(self, value):
         """Check if value consists only of valid emails."""
         # Use the parent's handling of required fields, etc.
         super().validate(value)
         for email in value:
+            if not _EMAIL_QUICK.match(email):
+                raise ValidationError(validate_email.message, code=validate_email.code)
             validate_email(email)
 
 class TeamInviteForm(forms.Form):
     to = MultiEmailField(label="", widget=forms.widgets.Textarea)
 
 
-class TeamEventForm(forms.ModelForm):
+class EventTimeFormMixin:
+    """Interprets the submitted start and end times in the event's timezone.
+    """
+    def clean(self):
+        cleaned_data = super().clean()
+        event_tz = _tz(self.instance.tz)
+        for field in ('start_time', 'end_time'):
+            if cleaned_data.get(field):
+                cleaned_data[field] = _to_utc(cleaned_data[field], event_tz)
+        return cleaned_data
+
+class RecurringEventForm(forms.ModelForm):
+    """Base for event forms that let the user set up a repeating event.
+    """
     # Translators: Repeating/recurring events
     recurrences = recurrence.forms.RecurrenceField(label=_("Repeat"), required=False)
+
+class TeamEventForm(EventTimeFormMixin, RecurringEventForm):
     class Meta:
         model = Event
         fields = ['name', 'start_time', 'end_time', 'recurrences', 'summary', 'web_url', 'announce_url', 'enable_comments', 'enable_photos', 'enable_presentations']
@@ -261,19 +373,10 @@ class TeamEventForm(forms.ModelForm):
         }
     def __init__(self, *args, **kargs):
         super().__init__(*args, **kargs)
-        event_tz = pytz.timezone(self.instance.tz)
         if self.instance.local_start_time: self.initial['start_time'] = self.instance.local_start_time
         if self.instance.local_end_time: self.initial['end_time'] = self.instance.local_end_time
 
-    def clean(self):
-        cleaned_data = super().clean()
-        event_tz = pytz.timezone(self.instance.tz)
-        cleaned_data['start_time'] = pytz.utc.localize(timezone.make_naive(event_tz.localize(timezone.make_naive(cleaned_data['start_time']))))
-        cleaned_data['end_time'] = pytz.utc.localize(timezone.make_naive(event_tz.localize(timezone.make_naive(cleaned_data['end_time']))))
-        return cleaned_data
-
-class NewTeamEventForm(forms.ModelForm):
-    recurrences = recurrence.forms.RecurrenceField(label=_("Repeat"), required=False)
+class NewTeamEventForm(EventTimeFormMixin, RecurringEventForm):
     class Meta:
         model = Event
         fields = ['name', 'start_time', 'end_time', 'recurrences', 'summary']
@@ -283,19 +386,11 @@ class NewTeamEventForm(forms.ModelForm):
         }
     def __init__(self, *args, **kargs):
         super().__init__(*args, **kargs)
-        event_tz = pytz.timezone(self.instance.tz)
         if self.instance.local_start_time: self.initial['start_time'] = self.instance.local_start_time
         if self.instance.local_end_time: self.initial['end_time'] = self.instance.local_end_time
 
-    def clean(self):
-        cleaned_data = super().clean()
-        event_tz = pytz.timezone(self.instance.tz)
-        cleaned_data['start_time'] = pytz.utc.localize(timezone.make_naive(event_tz.localize(timezone.make_naive(cleaned_data['start_time']))))
-        cleaned_data['end_time'] = pytz.utc.localize(timezone.make_naive(event_tz.localize(timezone.make_naive(cleaned_data['end_time']))))
-        return cleaned_data
-
 
-class NewEventForm(forms.ModelForm):
+class NewEventForm(EventTimeFormMixin, forms.ModelForm):
 
     class Meta:
         model = Event
@@ -307,20 +402,11 @@ class NewEventForm(forms.ModelForm):
 
     def __init__(self, *args, **kargs):
         super().__init__(*args, **kargs)
-        event_tz = pytz.timezone(self.instance.tz)
         if self.instance.local_start_time: self.initial['start_time'] = self.instance.local_start_time
         if self.instance.local_end_time: self.initial['end_time'] = self.instance.local_end_time
 
-    def clean(self):
-        cleaned_data = super().clean()
-        event_tz = pytz.timezone(self.instance.tz)
-        cleaned_data['start_time'] = pytz.utc.localize(timezone.make_naive(event_tz.localize(timezone.make_naive(cleaned_data['start_time']))))
-        cleaned_data['end_time'] = pytz.utc.localize(timezone.make_naive(event_tz.localize(timezone.make_naive(cleaned_data['end_time']))))
-        return cleaned_data
 
-
-class NewEventDetailsForm(forms.ModelForm):
-    recurrences = recurrence.forms.RecurrenceField(label=_("Repeat"), required=False)
+class NewEventDetailsForm(RecurringEventForm):
 
     class Meta:
         model = Event
@@ -384,7 +470,7 @@ class SponsorForm(forms.ModelForm):
         model = Sponsor
         fields = ['name', 'web_url', 'logo']
 
-class NewPlaceForm(forms.ModelForm):
+class NewPlaceForm(LookupFormMixin, forms.ModelForm):
     class Meta:
         model = Place
         fields = ['name', 'address', 'city', 'longitude', 'latitude', 'place_url', 'tz']
@@ -400,7 +486,7 @@ class UserForm(forms.ModelForm):
         model = User
         fields = ['email']
 
-class UserProfileForm(forms.ModelForm):
+class UserProfileForm(LookupFormMixin, forms.ModelForm):
     class Meta:
         model = UserProfile
         fields = ['realname', 'web_url', 'city', 'tz', 'avatar', 'send_notifications', 'do_not_track']
@@ -415,7 +501,7 @@ class UserProfileForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         self.fields['city'].required = True
 
-class ConfirmProfileForm(forms.ModelForm):
+class ConfirmProfileForm(LookupFormMixin, forms.ModelForm):
     class Meta:
         model = UserProfile
         fields = ['avatar', 'realname', 'city']
@@ -434,7 +520,7 @@ class SendNotificationsForm(forms.ModelForm):
             'send_notifications': _('Send me notification emails'),
         }
         
-class SearchForm(forms.Form):
+class SearchForm(LookupFormMixin, forms.Form):
     city = forms.IntegerField(required=False, widget=Lookup(source=City, label='name'))
     distance = forms.IntegerField(label=_("Distance(km)"), required=True)
     class Meta:
@@ -475,7 +561,7 @@ class InviteToJoinOrgForm(forms.ModelForm):
 class AcceptInviteToJoinOrgForm(forms.Form):
     confirm = forms.BooleanField(label=_("Yes, add my team to this organization"), required=True)
 
-class CommonEventForm(forms.ModelForm):
+class CommonEventForm(LookupFormMixin, forms.ModelForm):
     class Meta:
         model = CommonEvent
         fields = [
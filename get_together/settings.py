@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/2.0/ref/settings/
 """
 
 import os
+import sys
 from django.utils.translation import gettext_lazy as _
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
@@ -90,6 +91,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'get_together.urls'
 
+# 'loaders' is left unset on purpose: Django wraps the default loaders in
+# django.template.loaders.cached.Loader whenever DEBUG is False, and DEBUG is
+# usually overridden after this point (local_settings.py, environ_settings.py).
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -215,6 +219,10 @@ MESSAGE_TAGS = {
     messages.ERROR: 'alert-danger',
 }
 
+# Password hashing strength only slows down the test suite
+if len(sys.argv) > 1 and sys.argv[1] == 'test':
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Keep this at the end of settings.py to allow overriding settings in local deployments
 try:
     from local_settings import *
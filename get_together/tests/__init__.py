@@ -1,6 +1,7 @@
 from django.test import TestCase
 
 from .events import *
+from .forms import *
 from .event_reminder import *
 from .speakers import *
 from .teams import *
@@ -0,0 +1,185 @@
+from django.test import TestCase
+from django.core.exceptions import ValidationError
+from model_mommy import mommy
+import datetime
+
+from events.forms import DateTimeWidget, Lookup, MultiEmailField, NewEventForm, NewPlaceForm, SearchForm, SimpleTimeWidget, TeamEventForm, TimeWidget
+from events.models import City, Event, Place, Team
+import pytz
+
+# Create your tests here.
+class LookupWidgetTests(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.city = mommy.make(City, name='Testville')
+
+    def tearDown(self):
+        super().tearDown()
+
+    def test_format_value_queries_source(self):
+        widget = Lookup(source=City, label='name')
+        with self.assertNumQueries(1):
+            option = widget.format_value(self.city.id)
+        self.assertEqual(option, '<option value="%s">Testville</option>' % self.city.id)
+
+    def test_format_value_uses_instance(self):
+        widget = Lookup(source=City, label='name', instance=self.city)
+        with self.assertNumQueries(0):
+            option = widget.format_value(str(self.city.id))
+        self.assertEqual(option, '<option value="%s">Testville</option>' % self.city.id)
+
+    def test_resolve_batch(self):
+        other_city = mommy.make(City, name='Otherville')
+        with self.assertNumQueries(1):
+            resolved = Lookup.resolve_batch({City: {self.city.id, other_city.id}})
+        self.assertEqual(resolved[(City, str(self.city.id))], self.city)
+        self.assertEqual(resolved[(City, str(other_city.id))], other_city)
+
+    def test_form_resolves_lookups_on_render(self):
+        with self.assertNumQueries(0):
+            form = SearchForm(initial={'city': self.city.id, 'distance': 50})
+        with self.assertNumQueries(1):
+            option = form.fields['city'].widget.format_value(self.city.id)
+        self.assertEqual(option, '<option value="%s">Testville</option>' % self.city.id)
+        with self.assertNumQueries(0):
+            form.fields['city'].widget.format_value(self.city.id)
+
+    def test_bound_form_does_not_query_until_rendered(self):
+        with self.assertNumQueries(0):
+            NewPlaceForm({'name': 'Test place', 'city': str(self.city.id)})
+            SearchForm({'city': str(self.city.id), 'distance': 50})
+
+    def test_bound_form_with_invalid_lookup_value(self):
+        form = NewPlaceForm({'name': 'Test place', 'city': 'abc'})
+        self.assertIs(form.is_valid(), False)
+        self.assertIn('city', form.errors)
+
+        form = SearchForm({'city': 'abc', 'distance': 50})
+        self.assertIs(form.is_valid(), False)
+        self.assertIn('city', form.errors)
+
+    def test_form_uses_cached_relation(self):
+        place = mommy.make(Place, city=self.city)
+        place = Place.objects.select_related('city').get(id=place.id)
+        with self.assertNumQueries(0):
+            form = NewPlaceForm(instance=place)
+            self.assertEqual(form.fields['city'].widget.instance, self.city)
+
+    def test_format_value_escapes_label(self):
+        city = mommy.make(City, name='<b>Testville</b>')
+        widget = Lookup(source=City, label='name')
+        self.assertEqual(
+            widget.format_value(city.id),
+            '<option value="%s">&lt;b&gt;Testville&lt;/b&gt;</option>' % city.id
+        )
+
+    def test_format_value_empty(self):
+        widget = Lookup(source=City, label='name')
+        with self.assertNumQueries(0):
+            option = widget.format_value(None)
+        self.assertEqual(option, '<option value="">--------</option>')
+
+class MultiEmailFieldTests(TestCase):
+
+    def test_splits_on_commas_and_whitespace(self):
+        field = MultiEmailField()
+        self.assertEqual(
+            field.clean('one@example.com, two@example.com\nthree@example.com,,'),
+            ['one@example.com', 'two@example.com', 'three@example.com']
+        )
+
+    def test_rejects_invalid_email(self):
+        field = MultiEmailField()
+        with self.assertRaises(ValidationError):
+            field.clean('one@example.com, not-an-email')
+        with self.assertRaises(ValidationError):
+            field.clean('one@example')
+
+class DateTimeWidgetTests(TestCase):
+
+    def test_decompress(self):
+        widget = DateTimeWidget()
+        self.assertEqual(widget.decompress(datetime.datetime(2018, 7, 4, 0, 30)), ('2018-07-04', '12:30 AM'))
+        self.assertEqual(widget.decompress(datetime.datetime(2018, 7, 4, 12, 0)), ('2018-07-04', '12:00 PM'))
+        self.assertEqual(widget.decompress(datetime.datetime(2018, 7, 4, 19, 30)), ('2018-07-04', '07:30 PM'))
+        self.assertEqual(widget.decompress(None), (None, None))
+
+class SimpleTimeWidgetTests(TestCase):
+
+    def value_from(self, value):
+        return SimpleTimeWidget().value_from_datadict({'start': value}, {}, 'start')
+
+    def test_value_from_datadict(self):
+        self.assertEqual(self.value_from('12:30 AM'), '00:30:00')
+        self.assertEqual(self.value_from('12:00 PM'), '12:00:00')
+        self.assertEqual(self.value_from('07:30 pm'), '19:30:00')
+
+    def test_value_from_datadict_malformed(self):
+        with self.assertRaises(ValueError):
+            self.value_from('13:00 PM')
+
+class TimeWidgetTests(TestCase):
+
+    def test_decompress_time(self):
+        widget = TimeWidget()
+        self.assertEqual(widget.decompress(datetime.time(0, 15)), (12, 15, 'AM'))
+        self.assertEqual(widget.decompress(datetime.time(12, 0)), (12, 0, 'PM'))
+        self.assertEqual(widget.decompress(datetime.time(18, 45)), (6, 45, 'PM'))
+        self.assertEqual(widget.decompress(None), (None, None, None))
+
+    def test_decompress_string(self):
+        widget = TimeWidget()
+        self.assertEqual(widget.decompress('12:30 AM'), (12, 30, 'AM'))
+        self.assertEqual(widget.decompress('07:00 PM'), (7, 0, 'PM'))
+        self.assertEqual(widget.decompress('12:00:00'), (12, 0, 'PM'))
+        self.assertEqual(widget.decompress('00:45:00'), (12, 45, 'AM'))
+
+    def test_value_from_datadict(self):
+        widget = TimeWidget()
+        data = {'start_0': '12', 'start_1': '30', 'start_2': 'AM'}
+        self.assertEqual(widget.value_from_datadict(data, {}, 'start'), '00:30:00')
+        data = {'start_0': '7', 'start_1': '15', 'start_2': 'PM'}
+        self.assertEqual(widget.value_from_datadict(data, {}, 'start'), '19:15:00')
+
+class EventTimeFormTests(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.team = mommy.make(Team, tz='America/New_York')
+
+    def tearDown(self):
+        super().tearDown()
+
+    def event_data(self, date, start, end):
+        return {
+            'name': 'Test event',
+            'start_time_0': date,
+            'start_time_1': start,
+            'end_time_0': date,
+            'end_time_1': end,
+        }
+
+    def test_converts_local_time_to_utc(self):
+        for form_class in (TeamEventForm, NewEventForm):
+            # Eastern Standard Time, the day before the 2018 DST change
+            form = form_class(self.event_data('2018-03-10', '07:00 PM', '09:30 PM'), instance=Event(team=self.team))
+            self.assertTrue(form.is_valid(), form.errors)
+            self.assertEqual(form.cleaned_data['start_time'], datetime.datetime(2018, 3, 11, 0, 0, tzinfo=pytz.utc))
+            self.assertEqual(form.cleaned_data['end_time'], datetime.datetime(2018, 3, 11, 2, 30, tzinfo=pytz.utc))
+
+            # Eastern Daylight Time, the day after
+            form = form_class(self.event_data('2018-03-12', '07:00 PM', '09:30 PM'), instance=Event(team=self.team))
+            self.assertTrue(form.is_valid(), form.errors)
+            self.assertEqual(form.cleaned_data['start_time'], datetime.datetime(2018, 3, 12, 23, 0, tzinfo=pytz.utc))
+            self.assertEqual(form.cleaned_data['end_time'], datetime.datetime(2018, 3, 13, 1, 30, tzinfo=pytz.utc))
+
+    def test_missing_end_time(self):
+        for form_class in (TeamEventForm, NewEventForm):
+            data = self.event_data('2018-03-10', '07:00 PM', '09:30 PM')
+            del data['end_time_0']
+            del data['end_time_1']
+            form = form_class(data, instance=Event(team=self.team))
+            self.assertFalse(form.is_valid())
+            self.assertIn('end_time', form.errors)
+            self.assertEqual(form.cleaned_data['start_time'], datetime.datetime(2018, 3, 11, 0, 0, tzinfo=pytz.utc))
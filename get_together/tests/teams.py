@@ -1,4 +1,4 @@
-from django.test import TestCase, Client
+from django.test import TestCase
 from django.shortcuts import resolve_url
 from django.utils import timezone
 from django.urls import reverse
@@ -15,6 +15,10 @@ from events.models import Team
 
 class TeamDisplayTests(TestCase):
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.team = mommy.make(Team)
+
     def setUp(self):
         super().setUp()
 
@@ -22,33 +26,25 @@ class TeamDisplayTests(TestCase):
         super().tearDown()
 
     def test_show_team(self):
-        team = mommy.make(Team)
-        team.save()
-
-        team_url = team.get_absolute_url()
+        team_url = self.team.get_absolute_url()
 
-        c = Client()
-        response = c.get(team_url)
-        assert(response.status_code == 200)
+        response = self.client.get(team_url)
+        self.assertEqual(response.status_code, 200)
 
     def test_show_about_team(self):
-        team = mommy.make(Team)
-        team.about_page = "about this team!"
-        team.save()
+        self.team.about_page = "about this team!"
+        self.team.save(update_fields=['about_page'])
 
-        team_about_url = reverse('show-team-about-by-slug', kwargs={'team_slug': team.slug})
+        team_about_url = reverse('show-team-about-by-slug', kwargs={'team_slug': self.team.slug})
 
-        c = Client()
-        response = c.get(team_about_url)
-        assert(response.status_code == 200)
+        response = self.client.get(team_about_url)
+        self.assertEqual(response.status_code, 200)
 
     def test_show_about_team_redirects_if_none(self):
-        team = mommy.make(Team)
-        team.about_page = ""
-        team.save()
+        self.team.about_page = ""
+        self.team.save(update_fields=['about_page'])
 
-        team_about_url = reverse('show-team-about-by-slug', kwargs={'team_slug': team.slug})
+        team_about_url = reverse('show-team-about-by-slug', kwargs={'team_slug': self.team.slug})
 
-        c = Client()
-        response = c.get(team_about_url)
-        assert(response.status_code == 302)
+        response = self.client.get(team_about_url)
+        self.assertEqual(response.status_code, 302)
@@ -468,7 +468,7 @@ def create_common_event_team_select(request, event_id):
 
 @login_required
 def edit_common_event(request, event_id):
-    event = get_object_or_404(CommonEvent, id=event_id)
+    event = get_object_or_404(CommonEvent.objects.select_related('country', 'spr', 'city', 'place'), id=event_id)
     org = event.organization
     if not request.user.profile.can_create_common_event(org):
         messages.add_message(request, messages.WARNING, message=_('You can not edit events for this org.'))
@@ -130,7 +130,7 @@ def create_team(request, *args, **kwargs):
 
 @login_required
 def edit_team(request, team_id):
-    team = get_object_or_404(Team, id=team_id)
+    team = get_object_or_404(Team.objects.select_related('city'), id=team_id)
     if not request.user.profile.can_edit_team(team):
         messages.add_message(request, messages.WARNING, message=_('You can not make changes to this team.'))
         return redirect('show-team-by-slug', team_slug=team.slug)
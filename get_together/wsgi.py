@@ -16,3 +16,8 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "get_together.settings")
 
 application = get_wsgi_application()
+
+# Load the URLconf and build the resolver's reverse lookup tables now, so the
+# first request handled by each worker doesn't have to.
+from django.urls import get_resolver
+get_resolver().reverse_dict